@@ -36,12 +36,15 @@ Module Members
 from __future__ import absolute_import
 from __future__ import division
 
+import bisect
 import collections
 import gzip
+import logging
 import mmap
 import os
 import re
 import six
+import struct
 import subprocess
 import tempfile
 
@@ -54,9 +57,9 @@ from elftools.elf.constants import P_FLAGS
 from elftools.elf.constants import SHN_INDICES
 from elftools.elf.descriptions import describe_e_type
 from elftools.elf.elffile import ELFFile
+from elftools.elf.enums import ENUM_ST_INFO_TYPE
 from elftools.elf.gnuversions import GNUVerDefSection
 from elftools.elf.relocation import RelocationSection
-from elftools.elf.sections import SymbolTableSection
 from elftools.elf.segments import InterpSegment
 
 # See https://github.com/Gallopsled/pwntools/issues/1189
@@ -88,6 +91,18 @@ from pwnlib.util.sh_string import sh_string
 
 log = getLogger(__name__)
 
+# Kernel version in linux_banner, e.g. 'Linux version 3.18.31-gd0846ecc'
+_linux_banner_expr = re.compile(r'Linux version (\S+)')
+
+# Elf32_Sym is (st_name, st_value, st_size, st_info, st_other, st_shndx)
+# Elf64_Sym is (st_name, st_info, st_other, st_shndx, st_value, st_size)
+_symbol_structs = {
+    (32, True):  struct.Struct('<IIIBBH'),
+    (32, False): struct.Struct('>IIIBBH'),
+    (64, True):  struct.Struct('<IBBHQQ'),
+    (64, False): struct.Struct('>IBBHQQ'),
+}
+
 __all__ = ['load', 'ELF']
 
 def _iter_symbols(sec):
@@ -194,10 +209,6 @@ class ELF(ELFFile):
     bits = 32
     bytes = 4
     path = '/path/to/the/file'
-    symbols = {}
-    got = {}
-    plt = {}
-    functions = {}
     endian = 'little'
     address = 0x400000
     linker = None
@@ -229,17 +240,15 @@ class ELF(ELFFile):
         if isinstance(self.arch, (bytes, six.text_type)):
             self.arch = self.arch.lower()
 
-        #: :class:`dotdict` of ``name`` to ``address`` for all symbols in the ELF
-        self.symbols = dotdict()
-
-        #: :class:`dotdict` of ``name`` to ``address`` for all Global Offset Table (GOT) entries
-        self.got = dotdict()
-
-        #: :class:`dotdict` of ``name`` to ``address`` for all Procedure Linkate Table (PLT) entries
-        self.plt = dotdict()
-
-        #: :class:`dotdict` of ``name`` to :class:`.Function` for each function in the ELF
-        self.functions = dotdict()
+        # Symbols, GOT and PLT entries, and functions are not loaded until
+        # one of them is first used.
+        #
+        # See: _populate_lazy_symbols
+        self._symbols   = None
+        self._got       = None
+        self._plt       = None
+        self._functions = None
+        self._symbol_table_names = None
 
         #: :class:`dict`: Linux kernel configuration, if this is a Linux kernel image
         self.config = {}
@@ -277,6 +286,9 @@ class ELF(ELFFile):
 
         self._sections = None
         self._segments = None
+        self._section_index = None
+        self._executable_segments = None
+        self._writable_segments = None
 
         #: IntervalTree which maps all of the loaded memory segments
         self.memory = intervaltree.IntervalTree()
@@ -291,16 +303,16 @@ class ELF(ELFFile):
             # The architecture may not be supported in pwntools
             self.native = False
 
+        # Position-independent files are loaded at zero.  Otherwise, use the
+        # lowest non-zero address of any loaded segment.
         self._address = 0
         if self.elftype != 'DYN':
-            for seg in self.iter_segments_by_type('PT_LOAD'):
-                addr = seg.header.p_vaddr
-                if addr == 0:
-                    continue
-                if addr < self._address or self._address == 0:
-                    self._address = addr
+            load_addrs = [s.header.p_vaddr for s in self._cached_segments()
+                          if s.header.p_type == 'PT_LOAD' and s.header.p_vaddr]
+            self._address = min(load_addrs or [0])
 
         self.load_addr = self._address
+        self._build_addr_index()
 
         # Try to figure out if we have a kernel configuration embedded
         IKCFG_ST=b'IKCFG_ST'
@@ -346,23 +358,6 @@ class ELF(ELFFile):
         #: ``True`` if the ELF is a shared library
         self.library = not self.executable and self.elftype == 'DYN'
 
-        try:
-            self._populate_symbols()
-        except Exception as e:
-            log.warn("Could not populate symbols: %s", e)
-
-        try:
-            self._populate_got()
-        except Exception as e:
-            log.warn("Could not populate GOT: %s", e)
-
-        try:
-            self._populate_plt()
-        except Exception as e:
-            log.warn("Could not populate PLT: %s", e)
-
-        self._populate_synthetic_symbols()
-        self._populate_functions()
         self._populate_kernel_version()
 
         if checksec:
@@ -492,11 +487,8 @@ class ELF(ELFFile):
         return describe_e_type(self.header.e_type).split()[0]
 
     def iter_segments(self):
-        # Yield and cache all the segments in the file
-        if self._segments is None:
-            self._segments = [self.get_segment(i) for i in range(self.num_segments())]
-
-        return iter(self._segments)
+        # Yield all the segments in the file, from the cache
+        return iter(self._cached_segments())
 
     @property
     def segments(self):
@@ -504,7 +496,15 @@ class ELF(ELFFile):
         :class:`list`: A list of :class:`elftools.elf.segments.Segment` objects
             for the segments in the ELF.
         """
-        return list(self.iter_segments())
+        return list(self._cached_segments())
+
+    def _cached_segments(self):
+        """Returns the segments, parsed once.  The list is shared, so
+        callers must not modify it."""
+        if self._segments is None:
+            self._segments = [self.get_segment(i) for i in range(self.num_segments())]
+
+        return self._segments
 
     def iter_segments_by_type(self, t):
         """
@@ -551,11 +551,8 @@ class ELF(ELFFile):
         return None
 
     def iter_sections(self):
-        # Yield and cache all the sections in the file
-        if self._sections is None:
-            self._sections = [self.get_section(i) for i in range(self.num_sections())]
-
-        return iter(self._sections)
+        # Yield all the sections in the file, from the cache
+        return iter(self._cached_sections())
 
     @property
     def sections(self):
@@ -563,13 +560,98 @@ class ELF(ELFFile):
         :class:`list`: A list of :class:`elftools.elf.sections.Section` objects
             for the segments in the ELF.
         """
-        return list(self.iter_sections())
+        return list(self._cached_sections())
+
+    def _cached_sections(self):
+        """Returns the sections, parsed once.  The list is shared, so
+        callers must not modify it."""
+        if self._sections is None:
+            self._sections = [self.get_section(i) for i in range(self.num_sections())]
+
+        return self._sections
+
+    def get_section_by_name(self, name):
+        """get_section_by_name(name) -> Section
+
+        Returns the cached :class:`elftools.elf.sections.Section` with the
+        specified name, or :const:`None` if there is no such section.
+
+        Example:
+
+            >>> bash = ELF(which('bash'))
+            >>> bash.get_section_by_name('.text') is bash.get_section_by_name('.text')
+            True
+            >>> bash.get_section_by_name('.nonexistent') is None
+            True
+        """
+        # Map each name to its index in the cached section list once, rather
+        # than parsing a fresh section header on every lookup
+        if self._section_index is None:
+            self._section_index = {s.name: i for i, s in enumerate(self._cached_sections())}
+
+        index = self._section_index.get(name)
+        if index is None:
+            return None
+
+        return self._cached_sections()[index]
 
     @property
     def dwarf(self):
         """DWARF info for the elf"""
         return self.get_dwarf_info()
 
+    @property
+    def symbols(self):
+        """:class:`dotdict` of ``name`` to ``address`` for all symbols in the ELF"""
+        if self._symbols is None:
+            self._populate_lazy_symbols()
+        return self._symbols
+
+    @symbols.setter
+    def symbols(self, value):
+        if self._symbols is None:
+            self._populate_lazy_symbols()
+        self._symbols = value
+
+    @property
+    def got(self):
+        """:class:`dotdict` of ``name`` to ``address`` for all Global Offset Table (GOT) entries"""
+        if self._got is None:
+            self._populate_lazy_symbols()
+        return self._got
+
+    @got.setter
+    def got(self, value):
+        if self._got is None:
+            self._populate_lazy_symbols()
+        self._got = value
+
+    @property
+    def plt(self):
+        """:class:`dotdict` of ``name`` to ``address`` for all Procedure Linkate Table (PLT) entries"""
+        if self._plt is None:
+            self._populate_lazy_symbols()
+        return self._plt
+
+    @plt.setter
+    def plt(self, value):
+        if self._plt is None:
+            self._populate_lazy_symbols()
+        self._plt = value
+
+    @property
+    def functions(self):
+        """:class:`dotdict` of ``name`` to :class:`.Function` for each function in the ELF"""
+        if self._functions is None:
+            self._populate_lazy_symbols()
+        return self._functions
+
+    @functions.setter
+    def functions(self, value):
+        if self._functions is None:
+            self._populate_lazy_symbols()
+        self._functions = value
+
     @property
     def sym(self):
         """:class:`dotdict`: Alias for :attr:`.ELF.symbols`"""
@@ -609,9 +691,12 @@ class ELF(ELFFile):
         delta     = new-self._address
         update    = lambda x: x+delta
 
-        self.symbols = dotdict({k:update(v) for k,v in self.symbols.items()})
-        self.plt     = dotdict({k:update(v) for k,v in self.plt.items()})
-        self.got     = dotdict({k:update(v) for k,v in self.got.items()})
+        # Re-base the existing dictionaries in place, rather than re-hashing
+        # every name into a new one
+        for table in (self.symbols, self.plt, self.got):
+            for k in table:
+                table[k] += delta
+
         for f in self.functions.values():
             f.address += delta
 
@@ -626,6 +711,7 @@ class ELF(ELFFile):
         self.memory = memory
 
         self._address = update(self.address)
+        self._build_addr_index()
 
     def section(self, name):
         """section(name) -> bytes
@@ -638,7 +724,32 @@ class ELF(ELFFile):
         Returns:
             :class:`str`: String containing the bytes for that section
         """
-        return self.get_section_by_name(name).data()
+        return self._section_data(self.get_section_by_name(name))
+
+    def _section_data(self, section):
+        """Returns the data for a section.
+
+        Data stored as-is in the file is copied out of :meth:`_section_view`,
+        rather than seeking and reading the elftools stream.
+        """
+        return bytes(self._section_view(section))
+
+    def _section_view(self, section):
+        """Returns a view of the data for a section.
+
+        The contents are not copied out of :attr:`mmap`.  Sections without
+        file-backed data, and all sections on Python 2 (where an mmap does
+        not support :class:`memoryview`), fall back to a copy.
+        """
+        if section.header.sh_type == 'SHT_NOBITS' or getattr(section, 'compressed', False):
+            return section.data()
+
+        offset = section.header.sh_offset
+        size   = section.header.sh_size
+
+        if six.PY2:
+            return self.mmap[offset:offset+size]
+        return memoryview(self.mmap)[offset:offset+size]
 
     @property
     def rwx_segments(self):
@@ -651,7 +762,7 @@ class ELF(ELFFile):
             return self.writable_segments
 
         wx = P_FLAGS.PF_X | P_FLAGS.PF_W
-        return [s for s in self.segments if s.header.p_flags & wx == wx]
+        return [s for s in self._cached_segments() if s.header.p_flags & wx == wx]
 
     @property
     def executable_segments(self):
@@ -661,9 +772,11 @@ class ELF(ELFFile):
             :attr:`.ELF.segments`
         """
         if not self.nx:
-            return list(self.segments)
+            return list(self._cached_segments())
 
-        return [s for s in self.segments if s.header.p_flags & P_FLAGS.PF_X]
+        if self._executable_segments is None:
+            self._executable_segments = [s for s in self._cached_segments() if s.header.p_flags & P_FLAGS.PF_X]
+        return list(self._executable_segments)
 
     @property
     def writable_segments(self):
@@ -672,7 +785,9 @@ class ELF(ELFFile):
         See:
             :attr:`.ELF.segments`
         """
-        return [s for s in self.segments if s.header.p_flags & P_FLAGS.PF_W]
+        if self._writable_segments is None:
+            self._writable_segments = [s for s in self._cached_segments() if s.header.p_flags & P_FLAGS.PF_W]
+        return list(self._writable_segments)
 
     @property
     def non_writable_segments(self):
@@ -681,7 +796,7 @@ class ELF(ELFFile):
         See:
             :attr:`.ELF.segments`
         """
-        return [s for s in self.segments if not s.header.p_flags & P_FLAGS.PF_W]
+        return [s for s in self._cached_segments() if not s.header.p_flags & P_FLAGS.PF_W]
 
     @property
     def libs(self):
@@ -853,26 +968,145 @@ class ELF(ELFFile):
 
         return result
 
+    def _populate_lazy_symbols(self):
+        """Loads everything which is derived from the symbol tables and
+        relocations, the first time any of it is used.
+
+        >>> bash = ELF(which('bash'), checksec=False)
+        >>> bash._symbols is None
+        True
+        >>> bash.plt.read == bash.symbols.plt.read
+        True
+        >>> bash._symbols is None
+        False
+        """
+        # Populating accesses the lazy properties, so create them up front
+        self._symbols   = dotdict()
+        self._got       = dotdict()
+        self._plt       = dotdict()
+        self._functions = dotdict()
+
+        try:
+            self._populate_symbols()
+        except Exception as e:
+            log.warn("Could not populate symbols: %s", e)
+
+        try:
+            self._populate_got()
+        except Exception as e:
+            log.warn("Could not populate GOT: %s", e)
+
+        try:
+            self._populate_plt()
+        except Exception as e:
+            log.warn("Could not populate PLT: %s", e)
+
+        self._populate_synthetic_symbols()
+        self._populate_functions()
+
+    def _iter_symbol_entries(self, section):
+        """Iterates ``(name, value, size, type)`` for each entry in a symbol
+        table section, where ``type`` is the numeric ``STT_*`` value.
+
+        The entries are parsed once per section and cached on it, like
+        :func:`_iter_symbols`.
+        """
+        if not hasattr(section, '_symbol_entries'):
+            section._symbol_entries = list(self._parse_symbol_entries(section))
+        return iter(section._symbol_entries)
+
+    def _parse_symbol_entries(self, section):
+        """Yields ``(name, value, size, type)`` for each entry in a symbol
+        table section.
+
+        The entries are parsed straight out of the mapped file with the
+        precompiled :class:`struct.Struct` for this ELF's class and byte order,
+        rather than one stream read at a time by elftools.
+        """
+        sym     = _symbol_structs[self.elfclass, self.little_endian]
+        entsize = sym.size
+
+        data = self._section_view(section)
+
+        strtab  = self._cached_sections()[section.header.sh_link]
+        offset  = strtab.header.sh_offset
+        strings = self.mmap[offset:offset+strtab.header.sh_size]
+
+        step   = section.header.sh_entsize or entsize
+        is_32  = self.elfclass == 32
+        unpack = sym.unpack_from
+
+        for offset in range(0, len(data) - entsize + 1, step):
+            if is_32:
+                st_name, st_value, st_size, st_info, _, _ = unpack(data, offset)
+            else:
+                st_name, st_info, _, _, st_value, st_size = unpack(data, offset)
+
+            end = strings.find(b'\x00', st_name)
+            if end == -1:
+                end = len(strings)
+
+            name = six.ensure_str(strings[st_name:end], errors='replace')
+            yield name, st_value, st_size, st_info & 0xf
+
+    def _iter_symbol_tables(self):
+        """Yields each symbol table section in the ELF."""
+        for section in self._cached_sections():
+            if section.header.sh_type in ('SHT_SYMTAB', 'SHT_DYNSYM'):
+                yield section
+
+    def _find_symbol_value(self, name):
+        """Returns the first non-zero value of a symbol named ``name``, or
+        :const:`None`, without loading :attr:`symbols`.
+
+        The string tables are searched for the name first, so that the
+        symbol tables are only parsed when it might be there.
+        """
+        needle   = six.ensure_binary(name) + b'\x00'
+        sections = self._cached_sections()
+
+        for section in self._iter_symbol_tables():
+            strtab = sections[section.header.sh_link]
+            offset = strtab.header.sh_offset
+            if self.mmap.find(needle, offset, offset + strtab.header.sh_size) == -1:
+                continue
+
+            for entry_name, value, _, _ in self._iter_symbol_entries(section):
+                if entry_name == name and value:
+                    return value
+
+        return None
+
+    def _symbol_names(self):
+        """Returns the :class:`set` of names in all of the symbol tables.
+
+        Every name in :attr:`symbols`, :attr:`got` and :attr:`plt` comes from
+        here, so this answers "is there a symbol named X" without loading them.
+        """
+        if self._symbol_table_names is None:
+            self._symbol_table_names = set(entry[0] for section in self._iter_symbol_tables()
+                                                    for entry in self._iter_symbol_entries(section))
+        return self._symbol_table_names
+
     def _populate_functions(self):
         """Builds a dict of 'functions' (i.e. symbols of type 'STT_FUNC')
         by function name that map to a tuple consisting of the func address and size
         in bytes.
         """
-        for sec in self.sections:
-            if not isinstance(sec, SymbolTableSection):
-                continue
+        functions = self.functions
+        symbols   = self.symbols
+        STT_FUNC  = ENUM_ST_INFO_TYPE['STT_FUNC']
 
-            for sym in _iter_symbols(sec):
+        for sec in self._iter_symbol_tables():
+            for name, _, size, type in self._iter_symbol_entries(sec):
                 # Avoid duplicates
-                if sym.name in self.functions:
+                if name in functions:
                     continue
-                if sym.entry.st_info['type'] == 'STT_FUNC' and sym.entry.st_size != 0:
-                    name = sym.name
-                    if name not in self.symbols:
+                if type == STT_FUNC and size != 0:
+                    if name not in symbols:
                         continue
-                    addr = self.symbols[name]
-                    size = sym.entry.st_size
-                    self.functions[name] = Function(name, addr, size, self)
+                    addr = symbols[name]
+                    functions[name] = Function(name, addr, size, self)
 
     def _populate_symbols(self):
         """
@@ -880,17 +1114,17 @@ class ELF(ELFFile):
         >>> bash.symbols['_start'] == bash.entry
         True
         """
+        symbols = self.symbols
 
-        # Populate all of the "normal" symbols from the symbol tables
-        for section in self.sections:
-            if not isinstance(section, SymbolTableSection):
-                continue
+        # Section and file symbols do not name anything useful
+        skip = (ENUM_ST_INFO_TYPE['STT_SECTION'], ENUM_ST_INFO_TYPE['STT_FILE'])
 
-            for symbol in _iter_symbols(section):
-                value = symbol.entry.st_value
-                if not value:
+        # Populate all of the "normal" symbols from the symbol tables
+        for section in self._iter_symbol_tables():
+            for name, value, _, type in self._iter_symbol_entries(section):
+                if not value or type in skip:
                     continue
-                self.symbols[symbol.name] = value
+                symbols[name] = value
 
     def _populate_synthetic_symbols(self):
         """Adds symbols from the GOT and PLT to the symbols dictionary.
@@ -912,13 +1146,16 @@ class ELF(ELFFile):
             >>> bash.symbols.stdin  == bash.symbols.got.stdin
             True
         """
+        symbols    = self.symbols
+        setdefault = symbols.setdefault
+
         for symbol, address in self.plt.items():
-            self.symbols.setdefault(symbol, address)
-            self.symbols['plt.' + symbol] = address
+            setdefault(symbol, address)
+            symbols['plt.' + symbol] = address
 
         for symbol, address in self.got.items():
-            self.symbols.setdefault(symbol, address)
-            self.symbols['got.' + symbol] = address
+            setdefault(symbol, address)
+            symbols['got.' + symbol] = address
 
     def _populate_got(self):
         """Loads the symbols for all relocations"""
@@ -927,7 +1164,9 @@ class ELF(ELFFile):
         if self.statically_linked:
             return
 
-        for section in self.sections:
+        got = self.got
+
+        for section in self._cached_sections():
             # We are only interested in relocations
             if not isinstance(section, RelocationSection):
                 continue
@@ -936,18 +1175,15 @@ class ELF(ELFFile):
             if section.header.sh_link == SHN_INDICES.SHN_UNDEF:
                 continue
 
-            symbols = self.get_section(section.header.sh_link)
-
-            for rel in section.iter_relocations():
-                sym_idx  = rel.entry.r_info_sym
+            # Only the names of the linked symbols are needed
+            symtab = self._cached_sections()[section.header.sh_link]
+            names  = [entry[0] for entry in self._iter_symbol_entries(symtab)]
 
-                if not sym_idx:
-                    continue
+            entries = (rel.entry for rel in section.iter_relocations())
+            relocs  = [(names[e.r_info_sym], e.r_offset) for e in entries]
 
-                symbol = symbols.get_symbol(sym_idx)
-
-                if symbol and symbol.name:
-                    self.got[symbol.name] = rel.entry.r_offset
+            # Symbol zero is the unnamed null symbol, so it is skipped as well
+            got.update((name, offset) for name, offset in relocs if name)
 
         if self.arch == 'mips':
             try:
@@ -991,11 +1227,15 @@ class ELF(ELFFile):
         # 'symtabno' is the total number of symbols
         symtabno = self.dynamic_value_by_tag('DT_MIPS_SYMTABNO')
 
+        mips_got = self._mips_got
+        got_syms = self.got
+        size     = self.bytes
+
         for i in range(symtabno - gotsym):
             symbol = next(symbol_iter)
-            self._mips_got[i + gotsym] = got
-            self.got[symbol.name] = got
-            got += self.bytes
+            mips_got[i + gotsym] = got
+            got_syms[symbol.name] = got
+            got += size
 
     def _populate_plt(self):
         """Loads the PLT symbols
@@ -1041,27 +1281,40 @@ class ELF(ELFFile):
                 res = emulate_plt_instructions(self,
                                                 dt_pltgot,
                                                 section.header.sh_addr,
-                                                section.data(),
+                                                self._section_data(section),
                                                 inv_symbols)
 
-                for address, target in sorted(res.items()):
-                    self.plt[inv_symbols[target]] = address
+                self.plt.update((inv_symbols[target], address)
+                                for address, target in sorted(res.items()))
 
-        for a,n in sorted({v:k for k,v in self.plt.items()}.items()):
-            log.debug('PLT %#x %s', a, n)
+        if log.isEnabledFor(logging.DEBUG):
+            for a,n in sorted({v:k for k,v in self.plt.items()}.items()):
+                log.debug('PLT %#x %s', a, n)
 
     def _populate_kernel_version(self):
-        if 'linux_banner' not in self.symbols:
+        """Sets :attr:`version` and :attr:`build` from ``linux_banner``, if
+        this is a Linux kernel image.
+
+        Files which only name ``linux_banner``, without giving it an
+        address, are not kernels.
+
+        >>> source = tempfile.mktemp(suffix='.s')
+        >>> write(source, '.section .rodata; .globl linux_banner; linux_banner: .asciz "Linux version 5.0"\\n')
+        >>> subprocess.check_call(pwnlib.asm._assembler() + ['-o', source + '.o', source])
+        0
+        >>> ELF(source + '.o', checksec=False).version
+        (0,)
+        """
+        address = self._find_symbol_value('linux_banner')
+        if not address:
             return
 
-        banner = self.string(self.symbols.linux_banner)
+        banner = self.string(address)
         
         # convert banner into a utf-8 string since re.search does not accept bytes anymore
         banner = banner.decode('utf-8')
         
-        # 'Linux version 3.18.31-gd0846ecc
-        regex = r'Linux version (\S+)'
-        match = re.search(regex, banner)
+        match = _linux_banner_expr.search(banner)
 
         if match:
             version = match.group(1)
@@ -1122,10 +1375,9 @@ class ELF(ELFFile):
         Search the ELF's virtual address space for the specified string.
 
         Notes:
-            Does not search empty space between segments, or uninitialized
-            data.  This will only return data that actually exists in the
-            ELF file.  Searching for a long string of NULL bytes probably
-            won't work.
+            Does not search empty space between segments.  Uninitialized
+            data at the end of a segment (e.g. ``.bss``) is searched as the
+            zero bytes it holds in memory.
 
         Arguments:
             needle(str): String to search for.
@@ -1155,6 +1407,16 @@ class ELF(ELFFile):
             >>> jmp_addr = next(binary.search(asm('jmp esp'), executable = True))
             >>> binary.read(jmp_addr, 2) == asm('jmp esp')
             True
+
+            Matches may run from the file data into the zero-filled ``.bss``.
+
+            >>> binary = ELF.from_assembly('.data; .ascii "flag"; .bss; .space 0x100')
+            >>> data = binary.get_section_by_name('.data').header.sh_addr
+            >>> bss  = binary.get_section_by_name('.bss').header.sh_addr
+            >>> next(binary.search(b'flag\\x00\\x00', writable = True)) == data
+            True
+            >>> bss + 0x80 in binary.search(b'\\x00' * 0x80, writable = True)
+            True
         """
         load_address_fixup = (self.address - self.load_addr)
 
@@ -1163,28 +1425,48 @@ class ELF(ELFFile):
         elif executable:
             segments = self.executable_segments
         else:
-            segments = self.segments
+            segments = self._cached_segments()
 
         for seg in segments:
-            addr   = seg.header.p_vaddr
+            addr   = seg.header.p_vaddr + load_address_fixup
             memsz  = seg.header.p_memsz
-            zeroed = memsz - seg.header.p_filesz
+            filesz = seg.header.p_filesz
             offset = seg.header.p_offset
-            data   = self.mmap[offset:offset+memsz]
-            data   += b'\x00' * zeroed
-            offset = 0
-            while True:
-                offset = data.find(needle, offset)
-                if offset == -1:
-                    break
-                yield (addr + offset + load_address_fixup)
-                offset += 1
+            end    = offset + filesz
+
+            # Search the file-backed data in place, without copying it out
+            pos = self.mmap.find(needle, offset, end)
+            while pos != -1:
+                yield addr + (pos - offset)
+                pos = self.mmap.find(needle, pos + 1, end)
+
+            if memsz <= filesz:
+                continue
+
+            # Matches which run off the end of the file-backed data, and into
+            # the zero-filled remainder of the segment
+            start = max(offset, end - len(needle) + 1)
+            data  = self.mmap[start:end] + b'\x00' * min(memsz - filesz, len(needle) - 1)
+            pos   = data.find(needle)
+            while pos != -1 and start + pos < end:
+                yield addr + (start + pos - offset)
+                pos = data.find(needle, pos + 1)
+
+            # Matches which lie entirely within the zero-filled remainder.
+            # An empty needle has already matched at the end of the file data.
+            if not needle.strip(b'\x00'):
+                for pos in range(filesz + (not needle), memsz - len(needle) + 1):
+                    yield addr + pos
 
     def offset_to_vaddr(self, offset):
         """offset_to_vaddr(offset) -> int
 
         Translates the specified offset to a virtual address.
 
+        Only the file data of ``PT_LOAD`` segments is mapped.  Offsets
+        which no loaded segment covers, such as those of non-allocated
+        sections, translate to :const:`None`.
+
         Arguments:
             offset(int): Offset to translate
 
@@ -1204,17 +1486,50 @@ class ELF(ELFFile):
             >>> bash.address += 0x123456
             >>> bash.address == bash.offset_to_vaddr(0)
             True
+            >>> bash.offset_to_vaddr(bash.get_section_by_name('.shstrtab').header.sh_offset) is None
+            True
         """
         load_address_fixup = (self.address - self.load_addr)
 
-        for segment in self.segments:
-            begin = segment.header.p_offset
-            size  = segment.header.p_filesz
-            end   = begin + size
-            if begin <= offset and offset <= end:
-                delta = offset - begin
-                return segment.header.p_vaddr + delta + load_address_fixup
-        return None
+        i = bisect.bisect_right(self._offset_starts, offset) - 1
+        if i < 0 or self._offset_ends[i] < offset:
+            return None
+
+        delta = offset - self._offset_starts[i]
+        return self._offset_vaddrs[i] + delta + load_address_fixup
+
+    def _build_addr_index(self):
+        """Builds sorted lookup tables for translating between virtual
+        addresses and file offsets, so that :meth:`vaddr_to_offset` and
+        :meth:`offset_to_vaddr` can binary-search them.
+
+        Must be re-built whenever :attr:`memory` is re-based.
+        """
+        load_address_fixup = (self.address - self.load_addr)
+
+        # File-backed intervals of memory, which are sorted and do not overlap
+        self._vaddr_starts  = []
+        self._vaddr_ends    = []
+        self._vaddr_offsets = []
+
+        for begin, end, segment in sorted(self.memory):
+            if segment in (None, b'\x00'):
+                continue
+
+            # Convert the address back to how it was when the segment was loaded
+            original = begin - load_address_fixup
+
+            self._vaddr_starts.append(begin)
+            self._vaddr_ends.append(end)
+            self._vaddr_offsets.append(segment.header.p_offset + original - segment.header.p_vaddr)
+
+        # File-backed ranges of the loaded segments, sorted by file offset
+        load_segments = [s for s in self.iter_segments_by_type('PT_LOAD') if s.header.p_filesz]
+        load_segments.sort(key=lambda s: s.header.p_offset)
+
+        self._offset_starts = [s.header.p_offset for s in load_segments]
+        self._offset_ends   = [s.header.p_offset + s.header.p_filesz for s in load_segments]
+        self._offset_vaddrs = [s.header.p_vaddr for s in load_segments]
 
     def _populate_memory(self):
         load_segments = list(filter(lambda s: s.header.p_type == 'PT_LOAD', self.iter_segments()))
@@ -1274,7 +1589,8 @@ class ELF(ELFFile):
 
         Returns:
             int: Offset within the ELF file which corresponds to the address,
-            or :const:`None`.
+            or :const:`None`.  Zero-filled memory, such as ``.bss``, has no
+            offset in the file.
 
         Examples:
             >>> bash = ELF(which('bash'))
@@ -1285,19 +1601,17 @@ class ELF(ELFFile):
             0
             >>> bash.vaddr_to_offset(0) is None
             True
+            >>> binary = ELF.from_assembly('.bss; .space 0x100')
+            >>> bss = binary.get_section_by_name('.bss').header.sh_addr
+            >>> binary.vaddr_to_offset(bss) is None
+            True
         """
+        i = bisect.bisect_right(self._vaddr_starts, address) - 1
+        if i < 0 or self._vaddr_ends[i] <= address:
+            return None
 
-        for interval in self.memory[address]:
-            segment = interval.data
-
-            # Convert the address back to how it was when the segment was loaded
-            address = (address - self.address) + self.load_addr
-
-            # Figure out the offset into the segment
-            offset = address - segment.header.p_vaddr
-
-            # Add the segment-base offset to the offset-within-the-segment
-            return segment.header.p_offset + offset
+        # Add the interval-base offset to the offset-within-the-interval
+        return self._vaddr_offsets[i] + (address - self._vaddr_starts[i])
 
     def read(self, address, count):
         r"""read(address, count) -> bytes
@@ -1375,6 +1689,13 @@ class ELF(ELFFile):
         if count == 0:
             return b''
 
+        # Fast path: the whole range is backed by one contiguous region of
+        # the file, so we can slice it straight out of the mapping.
+        i = bisect.bisect_right(self._vaddr_starts, address) - 1
+        if i >= 0 and address + count <= self._vaddr_ends[i]:
+            offset = self._vaddr_offsets[i] + (address - self._vaddr_starts[i])
+            return self.mmap[offset:offset+count]
+
         start = address
         stop = address + count
 
@@ -1425,6 +1746,8 @@ class ELF(ELFFile):
         Note:
             This routine does not check the bounds on the write to ensure
             that it stays in the same segment.
+            Addresses which have no file data, such as ``.bss``, are
+            not written.
 
         Examples:
           >>> bash = ELF(which('bash'))
@@ -1625,7 +1948,7 @@ class ELF(ELFFile):
         ...     actual = str(e.relro).lower()
         ...     assert actual == expected
         """
-        if not any('GNU_RELRO' in str(s.header.p_type) for s in self.segments):
+        if not any('GNU_RELRO' in str(s.header.p_type) for s in self._cached_segments()):
             return None
 
         if self.dynamic_by_tag('DT_BIND_NOW'):
@@ -1746,8 +2069,9 @@ class ELF(ELFFile):
         """:class:`bool`: Whether the current binary uses stack canaries."""
 
         # Sometimes there is no function for __stack_chk_fail,
-        # but there is an entry in the GOT
-        return '__stack_chk_fail' in (set(self.symbols) | set(self.got))
+        # but there is an entry in the GOT.  Both are named in the
+        # symbol tables.
+        return '__stack_chk_fail' in self._symbol_names()
 
     @property
     def packed(self):
@@ -1881,13 +2205,17 @@ class ELF(ELFFile):
         """:class:`str`: GNU Build ID embedded into the binary"""
         section = self.get_section_by_name('.note.gnu.build-id')
         if section:
-            return section.data()[16:]
+            return self._section_data(section)[16:]
         return None
 
     @property
     def fortify(self):
         """:class:`bool`: Whether the current binary was built with
         Fortify Source (``-DFORTIFY``)."""
+        # PLT entries are named after symbols, so only emulate the PLT
+        # when there is some *_chk symbol to find there
+        if not any(s.endswith('_chk') for s in self._symbol_names()):
+            return False
         if any(s.endswith('_chk') for s in self.plt):
             return True
         return False
@@ -1896,19 +2224,19 @@ class ELF(ELFFile):
     def asan(self):
         """:class:`bool`: Whether the current binary was built with
         Address Sanitizer (``ASAN``)."""
-        return any(s.startswith('__asan_') for s in self.symbols)
+        return any(s.startswith('__asan_') for s in self._symbol_names())
 
     @property
     def msan(self):
         """:class:`bool`: Whether the current binary was built with
         Memory Sanitizer (``MSAN``)."""
-        return any(s.startswith('__msan_') for s in self.symbols)
+        return any(s.startswith('__msan_') for s in self._symbol_names())
 
     @property
     def ubsan(self):
         """:class:`bool`: Whether the current binary was built with
         Undefined Behavior Sanitizer (``UBSAN``)."""
-        return any(s.startswith('__ubsan_') for s in self.symbols)
+        return any(s.startswith('__ubsan_') for s in self._symbol_names())
 
     def _update_args(self, kw):
         kw.setdefault('arch', self.arch)
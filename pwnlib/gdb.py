@@ -173,6 +173,9 @@ from pwnlib.util import proc
 
 log = getLogger(__name__)
 
+# Address and path of each library listed by 'info sharedlibrary'
+_sharedlibrary_expr = re.compile(r'(0x\S+)[^/]+(.*)')
+
 @LocalContext
 def debug_assembly(asm, gdbscript=None, vma=None, api=False):
     r"""debug_assembly(asm, gdbscript=None, vma=None, api=False) -> tube
@@ -1141,7 +1144,6 @@ def find_module_addresses(binary, ssh=None, ulimit=False):
     #
     libs = {}
     cmd  = "gdb -q -nh --args %s | cat" % (binary) # pipe through cat to disable colored output on GDB 9+
-    expr = re.compile(r'(0x\S+)[^/]+(.*)')
 
     if ulimit:
         cmd = ['sh', '-c', "(ulimit -s unlimited; %s)" % cmd]
@@ -1160,10 +1162,8 @@ def find_module_addresses(binary, ssh=None, ulimit=False):
         gdb.sendline('info sharedlibrary')
         lines = context._decode(gdb.recvrepeat(2))
 
-        for line in lines.splitlines():
-            m = expr.match(line)
-            if m:
-                libs[m.group(2)] = int(m.group(1),16)
+        matches = (_sharedlibrary_expr.match(line) for line in lines.splitlines())
+        libs.update((m.group(2), int(m.group(1),16)) for m in matches if m)
         gdb.sendline('kill')
         gdb.sendline('y')
         gdb.sendline('quit')
@@ -1,7 +1,8 @@
 <%
-    from pwnlib.util import lists, packing, fiddling
+    from pwnlib.util import packing, fiddling
     from pwnlib.shellcraft import pretty
     import six
+    import struct
 %>\
 <%page args="string, append_null = True"/>
 <%docstring>
@@ -76,12 +77,17 @@ Args:
         extend = b'\xff'
     else:
         extend = b'\x00'
+
+    # Pad a single buffer in place, then decode every qword at once
+    padded = bytearray(string)
+    padded.extend(extend * (-len(padded) % 8))
+    words  = [padded[i:i+8] for i in range(0, len(padded), 8)]
+    signs  = struct.unpack('<%dq' % len(words), padded)
 %>\
     /* push ${pretty(string, False)} */
-% for word in lists.group(8, string, 'fill', extend)[::-1]:
+% for word, sign in list(zip(words, signs))[::-1]:
 <%
-    sign = packing.u64(word, endian='little', sign='signed')
-    sign32 = packing.u32(word[:4], bits=32, endian='little', sign='signed')
+    sign32 = (sign & 0x7fffffff) - (sign & 0x80000000)
 %>\
 % if sign in [0, 0xa]:
     push ${pretty(sign + 1)}
@@ -96,20 +102,18 @@ Args:
 % elif sign32 > 0 and word[4:] == b'\x00\x00\x00\x00':
 <%
     a,b = fiddling.xor_pair(word[:4], avoid = b'\x00\n')
-    a   = packing.u32(a, endian='little', sign='signed')
-    b   = packing.u32(b, endian='little', sign='unsigned')
+    a   = pretty(packing.u32(a, endian='little', sign='signed'))
 %>\
-    push ${pretty(a)} ^ ${pretty(sign)}
-    xor dword ptr [rsp], ${pretty(a)}
+    push ${a} ^ ${pretty(sign)}
+    xor dword ptr [rsp], ${a}
 % else:
 <%
     a,b = fiddling.xor_pair(word, avoid = b'\x00\n')
-    a   = packing.u64(a, endian='little', sign='unsigned')
-    b   = packing.u64(b, endian='little', sign='unsigned')
+    a   = pretty(packing.u64(a, endian='little', sign='unsigned'))
 %>\
-    mov rax, ${pretty(a)}
+    mov rax, ${a}
     push rax
-    mov rax, ${pretty(a)} ^ ${pretty(sign)}
+    mov rax, ${a} ^ ${pretty(sign)}
     xor [rsp], rax
 % endif
 % endfor
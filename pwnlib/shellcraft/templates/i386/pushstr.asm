@@ -1,7 +1,8 @@
 <%
-    from pwnlib.util import lists, packing, fiddling
+    from pwnlib.util import packing, fiddling
     from pwnlib.shellcraft import pretty, okay
     import six
+    import struct
 %>
 <%page args="string, append_null = True"/>
 <%docstring>
@@ -79,12 +80,15 @@ if six.indexbytes(string, -1) >= 128:
     extend = b'\xff'
 else:
     extend = b'\x00'
+
+# Pad a single buffer in place, then decode every dword at once
+padded = bytearray(string)
+padded.extend(extend * (-len(padded) % 4))
+words  = [padded[i:i+4] for i in range(0, len(padded), 4)]
+signs  = struct.unpack('<%di' % len(words), padded)
 %>\
     /* push ${pretty(original, False)} */
-% for word in lists.group(4, string, 'fill', extend)[::-1]:
-<%
-    sign = packing.u32(word, endian='little', sign='signed')
-%>\
+% for word, sign in list(zip(words, signs))[::-1]:
 % if sign in [0, 0xa]:
     push ${pretty(sign + 1)}
     dec byte ptr [esp]
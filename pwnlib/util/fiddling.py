@@ -348,6 +348,35 @@ def xor(*args, **kwargs):
 
     return b''.join(map(get, range(cut)))
 
+_xor_pair_tables = {}
+
+def _xor_pair_table(avoid):
+    """Returns a pair of 256-byte translation tables, which map each byte to
+    the two bytes :func:`xor_pair` would pick for it, along with the set of
+    bytes which cannot be produced without using ``avoid``.
+
+    The tables are built once per ``avoid`` and cached.
+    """
+    if avoid not in _xor_pair_tables:
+        alphabet = [n for n in range(256) if n not in bytearray(avoid)]
+        allowed  = set(alphabet)
+        table1   = bytearray(256)
+        table2   = bytearray(256)
+        missing  = set()
+
+        for c1 in range(256):
+            for c2 in alphabet:
+                if c1 ^ c2 in allowed:
+                    table1[c1] = c2
+                    table2[c1] = c1 ^ c2
+                    break
+            else:
+                missing.add(c1)
+
+        _xor_pair_tables[avoid] = (bytes(table1), bytes(table2), missing)
+
+    return _xor_pair_tables[avoid]
+
 def xor_pair(data, avoid = b'\x00\n'):
     """xor_pair(data, avoid = '\\x00\\n') -> None or (str, str)
 
@@ -365,6 +394,8 @@ def xor_pair(data, avoid = b'\x00\n'):
 
         >>> xor_pair(b"test")
         (b'\\x01\\x01\\x01\\x01', b'udru')
+        >>> xor_pair(b'\\x01', avoid = bytes(bytearray(range(1, 256)))) is None
+        True
     """
 
     if isinstance(data, six.integer_types):
@@ -373,6 +404,17 @@ def xor_pair(data, avoid = b'\x00\n'):
     if not isinstance(avoid, bytes):
         avoid = avoid.encode('utf-8')
 
+    # Without randomization the choice for each byte is always the same,
+    # so translate the whole string through a precomputed table.
+    if not context.randomize:
+        data = bytes(bytearray(data))
+        table1, table2, missing = _xor_pair_table(avoid)
+
+        if missing.intersection(bytearray(data)):
+            return None
+
+        return data.translate(table1), data.translate(table2)
+
     avoid = bytearray(avoid)
     alphabet = list(packing._p8lu(n) for n in range(256) if n not in avoid)
 
@@ -380,8 +422,7 @@ def xor_pair(data, avoid = b'\x00\n'):
     res2 = b''
 
     for c1 in bytearray(data):
-        if context.randomize:
-            random.shuffle(alphabet)
+        random.shuffle(alphabet)
         for c2 in alphabet:
             c3 = packing._p8lu(c1 ^ packing.u8(c2))
             if c3 in alphabet:
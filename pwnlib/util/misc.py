@@ -19,6 +19,10 @@ from pwnlib.util import lists
 
 log = getLogger(__name__)
 
+# Library lines in ldd output, on Linux and OpenBSD respectively
+_ldd_linux_expr   = re.compile(r'\s(?P<lib>\S?/\S+)\s+\((?P<addr>0x.+)\)')
+_ldd_openbsd_expr = re.compile(r'^\s+(?P<addr>[0-9a-f]+)\s+[0-9a-f]+\s+\S+\s+[01]\s+[0-9]+\s+[0-9]+\s+(?P<lib>\S+)$')
+
 def align(alignment, x):
     """align(alignment, x) -> int
 
@@ -304,12 +308,10 @@ def parse_ldd_output(output):
         ... ''').keys())
         ['/lib/x86_64-linux-gnu/libc.so.6', '/lib/x86_64-linux-gnu/libdl.so.2', '/lib/x86_64-linux-gnu/libtinfo.so.5', '/lib64/ld-linux-x86-64.so.2']
     """
-    expr_linux   = re.compile(r'\s(?P<lib>\S?/\S+)\s+\((?P<addr>0x.+)\)')
-    expr_openbsd = re.compile(r'^\s+(?P<addr>[0-9a-f]+)\s+[0-9a-f]+\s+\S+\s+[01]\s+[0-9]+\s+[0-9]+\s+(?P<lib>\S+)$')
     libs = {}
 
     for s in output.split('\n'):
-        match = expr_linux.search(s) or expr_openbsd.search(s)
+        match = _ldd_linux_expr.search(s) or _ldd_openbsd_expr.search(s)
         if not match:
             continue
         lib, addr = match.group('lib'), match.group('addr')